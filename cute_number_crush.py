@@ -10,9 +10,19 @@ Controls:
 """
 
 import pygame
-import random
 import sys
-from collections import deque
+from collections import OrderedDict, deque, namedtuple
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional; the plain numpy code paths are used instead
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        return lambda fn: fn
 
 # ---------------- Configuration ----------------
 ROWS = 8
@@ -24,6 +34,8 @@ FPS = 60
 
 # Use 6 types (numbers 0..5) like candy crush variety
 TILE_TYPES = list(range(6))  # numbers shown on tiles
+MATCH_CACHE_SIZE = 64  # board states whose matches Board.find_matches remembers
+RNG_POOL_SIZE = 1024  # tile types drawn ahead per batch for fills and refills
 ANIM_SPEED = 10  # pixels per frame for swap / fall animations
 POP_ANIM_MS = 220
 SWAP_ANIM_FRAMES = 12
@@ -53,113 +65,215 @@ def clamp(x, a, b):
     return max(a, min(b, x))
 
 # ---------------- Tile / Board ----------------
-class Tile:
-    def __init__(self, type_id):
-        self.type = type_id  # integer type
-        self.pop_timer = 0   # pop animation if removed
-        self.falling = False # used if animating fall
+# Read-only view of a single cell; the board keeps its state in numpy arrays.
+Tile = namedtuple("Tile", ["type", "pop_timer", "falling"])
+
+# SWAR layout for match detection: each tile type takes one 4-bit nibble, so
+# a line of up to 16 tiles packs into a single uint64 (tile i in bits 4i..4i+3).
+_NIBBLE_LOW_BITS = np.uint64(0x1111111111111111)
+
+def _row_runs(grid):
+    """Boolean mask of cells that sit in a horizontal run of 3+ equal types.
+
+    Every row is packed into one uint64 and all rows are tested at once:
+    a nibble of ``row ^ (row >> 4)`` is zero exactly where a tile equals its
+    right-hand neighbour, and three such neighbours in a row mark a match.
+    """
+    cols = grid.shape[1]
+    shifts = np.arange(cols, dtype=np.uint64) * np.uint64(4)
+    packed = np.bitwise_or.reduce(grid.astype(np.uint64) << shifts, axis=1)
+    x = packed ^ (packed >> np.uint64(4))
+    # fold every nibble onto its low bit: set where neighbours differ
+    x = (x | (x >> np.uint64(1)) | (x >> np.uint64(2)) | (x >> np.uint64(3))) & _NIBBLE_LOW_BITS
+    # equal-to-right flags, only for tiles that have a right-hand neighbour
+    eq = ~x & (_NIBBLE_LOW_BITS & np.uint64((1 << (4 * (cols - 1))) - 1))
+    starts = eq & (eq >> np.uint64(4))
+    cells = starts | (starts << np.uint64(4)) | (starts << np.uint64(8))
+    return ((cells[:, None] >> shifts) & np.uint64(1)).astype(np.bool_)
+
+def _has_run(grid):
+    """Cheap pre-check: does any row or column hold three equal tiles in a row?"""
+    h_eq = grid[:, 1:] == grid[:, :-1]
+    v_eq = grid[1:] == grid[:-1]
+    if not (h_eq.any() or v_eq.any()):
+        return False
+    return bool((h_eq[:, 1:] & h_eq[:, :-1]).any() or (v_eq[1:] & v_eq[:-1]).any())
+
+def _match_mask(grid):
+    """Boolean mask of cells in a 3+ run, horizontally or vertically."""
+    return _row_runs(grid) | _row_runs(grid.T).T
+
+# ---------------- JIT kernels (used when numba is installed) ----------------
+@njit(boundscheck=False, cache=True)
+def _swar_runs_nb(packed, n):
+    """Nibble mask of the tiles in a 3+ run of a packed line of n tiles."""
+    x = packed ^ (packed >> 4)
+    x = (x | (x >> 1) | (x >> 2) | (x >> 3)) & 0x1111111111111111
+    eq = ~x & (0x1111111111111111 & ((1 << (4 * (n - 1))) - 1))
+    starts = eq & (eq >> 4)
+    return starts | (starts << 4) | (starts << 8)
+
+@njit(boundscheck=False, cache=True)
+def _row_runs_nb(grid):
+    """uint8 mask of cells in a horizontal 3+ run, same SWAR test as _row_runs on scalars."""
+    rows, cols = grid.shape
+    mask = np.zeros((rows, cols), dtype=np.uint8)
+    for r in range(rows):
+        packed = 0
+        for c in range(cols):
+            packed |= np.int64(grid[r, c]) << (4 * c)
+        cells = _swar_runs_nb(packed, cols)
+        for c in range(cols):
+            mask[r, c] = (cells >> (4 * c)) & 1
+    return mask
+
+@njit(boundscheck=False, cache=True)
+def _find_matches_nb(grid):
+    """uint8 mask of cells in a 3+ run, horizontally or vertically."""
+    return _row_runs_nb(grid) | _row_runs_nb(grid.T).T
+
+@njit(boundscheck=False, cache=True)
+def _collapse_nb(grid, mask, fresh):
+    """Drop the masked cells of every column in place, refilling the top from fresh."""
+    rows, cols = grid.shape
+    k = 0
+    for c in range(cols):
+        write = rows - 1
+        for r in range(rows - 1, -1, -1):
+            if not mask[r, c]:
+                grid[write, c] = grid[r, c]
+                write -= 1
+        while write >= 0:
+            grid[write, c] = fresh[k]
+            k += 1
+            write -= 1
+
+def _warm_kernels():
+    """Compile (or load from the cache) every kernel for the dtypes the board uses.
+
+    numba compiles on first call, which would otherwise stall the first match mid-animation.
+    """
+    grid = np.zeros((ROWS, COLS), dtype=np.int8)
+    mask = _find_matches_nb(grid) != 0  # every cell of the uniform board
+    for dtype in (np.int8, np.uint8, np.bool_):
+        _collapse_nb(np.zeros((ROWS, COLS), dtype=dtype), mask, np.zeros(ROWS * COLS, dtype=dtype))
 
 class Board:
     def __init__(self, rows=ROWS, cols=COLS):
         self.rows = rows
         self.cols = cols
-        self.grid = [[Tile(random.choice(TILE_TYPES)) for _ in range(cols)] for _ in range(rows)]
-        # ensure no immediate matches on initial fill
-        self._remove_initial_matches()
-
-    def _remove_initial_matches(self):
-        # Regenerate any tile that forms a match immediately
+        # tile type ids, with the per-tile animation state in parallel arrays
+        self.grid = np.zeros((rows, cols), dtype=np.int8)
+        self.pop_timer = np.zeros((rows, cols), dtype=np.uint8)  # pop animation if removed
+        self.falling = np.zeros((rows, cols), dtype=np.bool_)    # used if animating fall
+        self._match_cache = OrderedDict()  # grid bytes -> frozenset of matches (LRU)
+        self._rng_pool = np.empty(0, dtype=np.int8)  # pre-drawn tile types
+        self._rng_idx = 0
+        # initial fill never contains a match
+        self._fill_without_matches()
+
+    def _fill_without_matches(self):
+        """Fill the grid in one pass, never picking a type that completes a 3-in-a-row.
+
+        Cells are filled left-to-right, top-to-bottom, so only the two cells
+        to the left and the two above can form a match with the new one.
+        """
+        g = self.grid
         for r in range(self.rows):
             for c in range(self.cols):
-                while True:
-                    if self._is_match_at(r, c):
-                        self.grid[r][c] = Tile(random.choice(TILE_TYPES))
-                    else:
-                        break
-
-    def _is_match_at(self, r, c):
-        """Check if tile at r,c forms a 3+ match with neighbors (used only on init)."""
-        t = self.grid[r][c].type
-        # horizontal
-        count = 1
-        cc = c - 1
-        while cc >= 0 and self.grid[r][cc].type == t:
-            count += 1; cc -= 1
-        cc = c + 1
-        while cc < self.cols and self.grid[r][cc].type == t:
-            count += 1; cc += 1
-        if count >= 3:
-            return True
-        # vertical
-        count = 1
-        rr = r - 1
-        while rr >= 0 and self.grid[rr][c].type == t:
-            count += 1; rr -= 1
-        rr = r + 1
-        while rr < self.rows and self.grid[rr][c].type == t:
-            count += 1; rr += 1
-        return count >= 3
+                forbidden = set()
+                if c >= 2 and g[r, c - 1] == g[r, c - 2]:
+                    forbidden.add(int(g[r, c - 1]))
+                if r >= 2 and g[r - 1, c] == g[r - 2, c]:
+                    forbidden.add(int(g[r - 1, c]))
+                t = self._fresh_type()
+                while t in forbidden:
+                    t = self._fresh_type()
+                g[r, c] = t
+
+    def _refill_pool(self):
+        self._rng_pool = np.random.randint(0, len(TILE_TYPES), size=RNG_POOL_SIZE, dtype=np.int8)
+        self._rng_idx = 0
+
+    def _fresh_type(self):
+        """Next random tile type from the pre-drawn pool."""
+        if self._rng_idx >= len(self._rng_pool):
+            self._refill_pool()
+        t = int(self._rng_pool[self._rng_idx])
+        self._rng_idx += 1
+        return t
+
+    def _fresh_types(self, n):
+        """Array of the next n random tile types from the pre-drawn pool."""
+        if self._rng_idx + n > len(self._rng_pool):
+            if n > RNG_POOL_SIZE:
+                return np.random.randint(0, len(TILE_TYPES), size=n, dtype=np.int8)
+            self._refill_pool()
+        out = self._rng_pool[self._rng_idx:self._rng_idx + n]
+        self._rng_idx += n
+        return out
 
     def get(self, r, c):
         if 0 <= r < self.rows and 0 <= c < self.cols:
-            return self.grid[r][c]
+            return Tile(int(self.grid[r, c]), int(self.pop_timer[r, c]), bool(self.falling[r, c]))
         return None
 
     def swap(self, r1, c1, r2, c2):
-        self.grid[r1][c1], self.grid[r2][c2] = self.grid[r2][c2], self.grid[r1][c1]
+        for a in (self.grid, self.pop_timer, self.falling):
+            a[r1, c1], a[r2, c2] = a[r2, c2], a[r1, c1]
 
     def find_matches(self):
-        """Return set of coordinates that form matches (3+ in a row or column)."""
-        to_remove = set()
-        # horizontal
-        for r in range(self.rows):
-            c = 0
-            while c < self.cols:
-                start = c
-                t = self.grid[r][c].type
-                c += 1
-                while c < self.cols and self.grid[r][c].type == t:
-                    c += 1
-                length = c - start
-                if length >= 3:
-                    for cc in range(start, c):
-                        to_remove.add((r, cc))
-        # vertical
-        for c in range(self.cols):
-            r = 0
-            while r < self.rows:
-                start = r
-                t = self.grid[r][c].type
-                r += 1
-                while r < self.rows and self.grid[r][c].type == t:
-                    r += 1
-                length = r - start
-                if length >= 3:
-                    for rr in range(start, r):
-                        to_remove.add((rr, c))
-        return to_remove
+        """Return set of coordinates that form matches (3+ in a row or column).
+
+        Results are memoized by grid contents, so rescanning a board state
+        seen recently (e.g. during cascades) is a dict lookup.
+        """
+        key = self.grid.tobytes()
+        cache = self._match_cache
+        matches = cache.get(key)
+        if matches is not None:
+            cache.move_to_end(key)
+            return matches
+        if not HAVE_NUMBA and not _has_run(self.grid):
+            # the common steady state: skip the numpy run extraction entirely
+            # (the JIT kernel is cheaper than this check, so it always runs)
+            matches = frozenset()
+        else:
+            if HAVE_NUMBA:
+                mask = _find_matches_nb(self.grid)
+            else:
+                mask = _match_mask(self.grid)
+            matches = frozenset(map(tuple, np.argwhere(mask).tolist()))
+        cache[key] = matches
+        if len(cache) > MATCH_CACHE_SIZE:
+            cache.popitem(last=False)
+        return matches
 
     def remove_and_collapse(self, remove_coords):
         """Remove tiles at given coords, collapse columns, fill with new tiles, return total tiles removed."""
-        # Mark removed positions with None
-        removed = 0
+        mask = np.zeros((self.rows, self.cols), dtype=np.bool_)
         for (r, c) in remove_coords:
-            if self.grid[r][c] is not None:
-                self.grid[r][c] = None
-                removed += 1
-
-        # Collapse each column
-        for c in range(self.cols):
-            stack = []
-            for r in range(self.rows - 1, -1, -1):
-                if self.grid[r][c] is not None:
-                    stack.append(self.grid[r][c])
-            # fill from bottom
-            for r in range(self.rows - 1, -1, -1):
-                if stack:
-                    self.grid[r][c] = stack.pop(0)  # pop from front since stack is bottom->top
-                else:
-                    self.grid[r][c] = Tile(random.choice(TILE_TYPES))
+            mask[r, c] = True
+        removed = int(mask.sum())
+
+        if HAVE_NUMBA:
+            # refill values are drawn in one batch; the kernel consumes them in order
+            fresh = self._fresh_types(removed)
+            _collapse_nb(self.grid, mask, fresh)
+            for state in (self.pop_timer, self.falling):
+                _collapse_nb(state, mask, np.zeros(removed, dtype=state.dtype))
+            return removed
+
+        # Collapse all columns at once: a stable sort on the keep mask moves the
+        # removed cells to the top of each column, survivors keep their order
+        order = np.argsort(~mask, axis=0, kind='stable')
+        gap = np.arange(self.rows)[:, None] < mask.sum(axis=0)
+        self.grid[:] = np.take_along_axis(self.grid, order, axis=0)
+        self.grid[gap] = self._fresh_types(removed)
+        # new tiles start without any animation state
+        for state in (self.pop_timer, self.falling):
+            state[:] = np.take_along_axis(state, order, axis=0)
+            state[gap] = 0
         return removed
 
 # ---------------- Game ----------------
@@ -176,82 +290,148 @@ class CandyLikeGame:
         self.screen = pygame.display.set_mode((self.width, self.height))
         pygame.display.set_caption("Cute Number Crush")
         self.clock = pygame.time.Clock()
+        self._dirty = []  # screen rects changed since the last display update
+        self._needs_redraw = True
         self.font_big = pygame.font.SysFont("Poppins", 26, bold=True)
         self.font_tile = pygame.font.SysFont("Poppins", 28, bold=True)
         self.font_small = pygame.font.SysFont("Poppins", 16)
+        self.build_tile_cache()
+        self.paused = False
+        self.build_static_bg()
+        self._score_rect = pygame.Rect(12, 52, 0, 0)
+        if HAVE_NUMBA:
+            _warm_kernels()
+        self.reset()
+
+    def reset(self):
+        """Start a new game, keeping the window, fonts and cached surfaces."""
         self.board = Board()
         self.selected = None  # (r,c) first click
         self.animating = False
         self.swap_animation = None  # dict holding swap animation info
+        self._pending_scan = False  # board changed since the last full match scan
         self.score = 0
         self.combo = 0
-        self.paused = False
+        if self.paused:
+            self.paused = False
+            self.build_static_bg()
         self.show_instructions = True
-
-        # Pre-calc board rect (use scaled values)
-        self.board_x = self.padding
-        self.board_y = self.top_margin
-        self.board_w = COLS * (self.tile_size + self.padding) + self.padding
-        self.board_h = ROWS * (self.tile_size + self.padding) + self.padding
-
-        # Initial check: clear any immediate matches (should already be done)
-        self.resolve_all_matches_initial()
+        self._shown_score = None
+        self.mark_dirty()
 
     # ---------- helpers ----------
     def tile_to_pixel(self, r, c):
-        x = self.board_x + self.padding + c * (self.tile_size + self.padding)
-        y = self.board_y + self.padding + r * (self.tile_size + self.padding)
-        return x, y
+        return self._tile_xy[r][c]
+
+    def tile_rect(self, r, c, grow=0):
+        x, y = self.tile_to_pixel(r, c)
+        return pygame.Rect(x - grow, y - grow, self.tile_size + grow * 2, self.tile_size + grow * 2)
+
+    def board_rect(self):
+        return pygame.Rect(self.board_x, self.board_y, self.board_w, self.board_h)
+
+    def mark_dirty(self, rect=None):
+        """Queue a screen rect for the next display update (None = whole window)."""
+        if rect is None:
+            rect = self.screen.get_rect()
+        self._dirty.append(pygame.Rect(rect))
+        self._needs_redraw = True
+
+    def present(self):
+        """Show the frame: update just the dirty rects when they are few and
+        small, otherwise flip the whole display."""
+        dirty = self._dirty
+        if not dirty:
+            return
+        self._dirty = []
+        area = sum(r.w * r.h for r in dirty)
+        if len(dirty) <= 8 and area < self.board_w * self.board_h // 4:
+            pygame.display.update(dirty)
+        else:
+            pygame.display.flip()
 
     def pixel_to_tile(self, mx, my):
-        mx -= self.board_x + self.padding
-        my -= self.board_y + self.padding
-        if mx < 0 or my < 0:
+        ox, oy = self._tile_xy[0][0]
+        mx -= ox
+        my -= oy
+        if not (0 <= mx < self._grid_w and 0 <= my < self._grid_h):
             return None
-        cell_w = self.tile_size + self.padding
-        c = int(mx // cell_w)
-        r = int(my // cell_w)
-        if 0 <= r < ROWS and 0 <= c < COLS:
-            # ensure inside tile area (not padding)
-            rx = mx % cell_w
-            ry = my % cell_w
-            if rx <= self.tile_size and ry <= self.tile_size:
-                return (r, c)
+        c, rx = divmod(mx, self._cell_w)
+        r, ry = divmod(my, self._cell_w)
+        # ensure inside tile area (not padding)
+        if rx <= self.tile_size and ry <= self.tile_size:
+            return (int(r), int(c))
         return None
 
     def draw_board(self):
-        # background
-        pygame.draw.rect(self.screen, BOARD_BG, (self.board_x, self.board_y, self.board_w, self.board_h), border_radius=14)
-        # draw tiles
-        for r in range(self.board.rows):
-            for c in range(self.board.cols):
-                tile = self.board.get(r, c)
-                if tile is None:
-                    continue
-                # if swapping animation affects these tiles, let animation handle draw
-                if self.swap_animation and ((r, c) == self.swap_animation.get('a') or (r, c) == self.swap_animation.get('b')):
-                    continue
-                x, y = self.tile_to_pixel(r, c)
-                self.draw_tile(tile, x, y)
+        # tiles are baked into _board_surface; repaint only the cells whose
+        # type changed since the last frame (the board background is part of _static_bg)
+        grid = self.board.grid
+        stale = np.argwhere(grid != self._drawn_types)
+        if len(stale):
+            surf = self._board_surface
+            ts = self.tile_size
+            cells = []
+            for r, c in stale.tolist():
+                x, y = self._tile_xy[r][c]
+                cells.append((int(grid[r, c]), (x - self.board_x, y - self.board_y)))
+            # clear all stale cells under a single lock; blits need it unlocked again
+            surf.lock()
+            try:
+                for _, pos in cells:
+                    surf.fill((0, 0, 0, 0), (pos, (ts, ts)))
+            finally:
+                surf.unlock()
+            # one batched call for all repainted cells
+            tile_surfs = self._tile_surfs
+            surf.blits([(tile_surfs[t], pos) for t, pos in cells], doreturn=False)
+            self._drawn_types[:] = grid
+        self.screen.blit(self._board_surface, (self.board_x, self.board_y))
 
         # draw swap anim overlays if any
         if self.swap_animation:
+            # the swapping tiles are drawn moving; clear their resting cells first
+            for cell in (self.swap_animation['a'], self.swap_animation['b']):
+                rect = self.tile_rect(*cell)
+                self.screen.blit(self._static_bg, rect, rect)
             self.draw_swap_anim()
 
+    def build_tile_cache(self):
+        """Pre-render each tile type at the current tile size and font.
+
+        Must be called again whenever tile_size or font_tile changes.
+        """
+        ts = self.tile_size
+        inner_pad = max(6, int(ts * 0.14))
+        self._num_surfs = {}
+        self._bg_surfs = {}
+        self._tile_surfs = {}
+        for t in TILE_TYPES:
+            num_surf = self.font_tile.render(str(t), True, TEXT_COLOR).convert_alpha()
+            # rounded background on its own, for faded or scaled draws
+            bg = pygame.Surface((ts, ts), pygame.SRCALPHA)
+            rect = bg.get_rect()
+            pygame.draw.rect(bg, TYPE_COLORS.get(t, (200,200,200)), rect, border_radius=10)
+            pygame.draw.rect(bg, TILE_BG, rect.inflate(-inner_pad * 2, -inner_pad * 2), border_radius=8)
+            bg = bg.convert_alpha()
+            surf = bg.copy()
+            surf.blit(num_surf, ((ts - num_surf.get_width()) // 2, (ts - num_surf.get_height()) // 2))
+            self._num_surfs[t] = num_surf
+            self._bg_surfs[t] = bg
+            self._tile_surfs[t] = surf.convert_alpha()
+        # the baked board holds tiles of the old size: start it over
+        self._board_surface = pygame.Surface((self.board_w, self.board_h), pygame.SRCALPHA).convert_alpha()
+        self._drawn_types = np.full((ROWS, COLS), -1, dtype=np.int8)
+
     def draw_tile(self, tile, x, y, alpha=255, scale=1.0):
-        rect = pygame.Rect(x, y, self.tile_size, self.tile_size)
-        # tile background (rounded)
-        color = TYPE_COLORS.get(tile.type, (200,200,200))
-        # soften color for background and a small white highlight
-        base = color
-        pygame.draw.rect(self.screen, base, rect, border_radius=10)
-        # small inner box for aesthetic
-        # inner padding scales with tile size
-        inner_pad = max(6, int(self.tile_size * 0.14))
-        inner = rect.inflate(-inner_pad * 2, -inner_pad * 2)
-        pygame.draw.rect(self.screen, TILE_BG, inner, border_radius=8)
+        # common case: the fully composed tile is cached per type
+        if alpha == 255 and scale == 1.0:
+            self.screen.blit(self._tile_surfs[tile.type], (x, y))
+            return
+        # tile background (rounded), pre-rendered per type
+        self.screen.blit(self._bg_surfs[tile.type], (x, y))
         # number text
-        num_surf = self.font_tile.render(str(tile.type), True, TEXT_COLOR)
+        num_surf = self._num_surfs[tile.type]
         # adjust for scale if any
         if scale != 1.0:
             num_surf = pygame.transform.rotozoom(num_surf, 0, scale)
@@ -260,6 +440,7 @@ class CandyLikeGame:
         ty = y + (self.tile_size - th) // 2
         # apply alpha
         if alpha < 255:
+            num_surf = num_surf.copy()  # don't fade the cached surface
             num_surf.set_alpha(alpha)
         self.screen.blit(num_surf, (tx, ty))
 
@@ -283,27 +464,23 @@ class CandyLikeGame:
         self.draw_tile(tile_b, bxn, byn)
 
     # ---------- matching & resolving ----------
-    def resolve_all_matches_initial(self):
-        # run a loop to remove matches (rare) until none remain
-        while True:
-            matches = self.board.find_matches()
-            if not matches:
-                break
-            self.board.remove_and_collapse(matches)
+    def find_and_resolve_matches(self, matches=None):
+        """Find matches, remove them, apply gravity, refill, return total removed and whether any removed.
 
-    def find_and_resolve_matches(self):
-        """Find matches, remove them, apply gravity, refill, return total removed and whether any removed."""
+        matches may pass in matches the caller has already found (e.g. right after a swap).
+        """
         total_removed = 0
         chain = 0
-        while True:
+        if matches is None:
             matches = self.board.find_matches()
-            if not matches:
-                break
+        while matches:
             chain += 1
             removed = self.board.remove_and_collapse(matches)
             total_removed += removed
+            self._pending_scan = True
             # increase score with chain multiplier
             self.score += removed * BASE_SCORE_PER_TILE * chain
+            matches = self.board.find_matches()
         return total_removed
 
     # ---------- swap logic ----------
@@ -342,17 +519,21 @@ class CandyLikeGame:
         sa = self.swap_animation
         sa['frame'] += 1
         sa['progress'] = sa['frame'] / sa['frames']
+        # both tiles move every frame
+        self.mark_dirty(self.tile_rect(*sa['a']).union(self.tile_rect(*sa['b'])))
         if sa['frame'] >= sa['frames']:
             # complete swap in model
             a = sa['a']; b = sa['b']
             self.board.swap(*a, *b)
+            self._pending_scan = True
             # check for matches
             matches = self.board.find_matches()
             if matches:
                 # keep swap; resolve matches
                 self.animating = False
                 self.swap_animation = None
-                removed = self.find_and_resolve_matches()
+                removed = self.find_and_resolve_matches(matches)
+                self.mark_dirty(self.board_rect())
                 if removed:
                     self.combo += 1
                 else:
@@ -372,12 +553,17 @@ class CandyLikeGame:
     def handle_click(self, pos):
         if self.show_instructions:
             self.show_instructions = False
+            self.mark_dirty()
             return
         if self.animating or self.paused:
             return
         clicked = self.pixel_to_tile(*pos)
         if not clicked:
             return
+        # selection highlight changes on the old and the clicked tile
+        if self.selected is not None:
+            self.mark_dirty(self.tile_rect(*self.selected, grow=4))
+        self.mark_dirty(self.tile_rect(*clicked, grow=4))
         if self.selected is None:
             self.selected = clicked
         else:
@@ -395,6 +581,19 @@ class CandyLikeGame:
         self.top_margin = max(60, int(TOP_MARGIN * self.scale))
         self.width = COLS * (self.tile_size + self.padding) + self.padding
         self.height = ROWS * (self.tile_size + self.padding) + self.padding + self.top_margin
+        # board rect (use scaled values)
+        self.board_x = self.padding
+        self.board_y = self.top_margin
+        self.board_w = COLS * (self.tile_size + self.padding) + self.padding
+        self.board_h = ROWS * (self.tile_size + self.padding) + self.padding
+        # tile positions and hit-test sizes only change with the layout
+        cell_w = self.tile_size + self.padding
+        ox = self.board_x + self.padding
+        oy = self.board_y + self.padding
+        self._tile_xy = tuple(tuple((ox + c * cell_w, oy + r * cell_w) for c in range(COLS)) for r in range(ROWS))
+        self._cell_w = cell_w
+        self._grid_w = COLS * cell_w
+        self._grid_h = ROWS * cell_w
 
     def toggle_touch_mode(self, enable=None):
         """Toggle touch-friendly (larger UI) mode. If enable is None, toggle current state."""
@@ -411,28 +610,60 @@ class CandyLikeGame:
             self.screen = pygame.display.set_mode((self.width, self.height))
         except Exception:
             pass
+        self.mark_dirty()
 
     def toggle_fullscreen(self):
         """Toggle fullscreen mode."""
         is_fs = bool(self.screen.get_flags() & pygame.FULLSCREEN)
         if not is_fs:
-            pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+            self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
         else:
-            pygame.display.set_mode((self.width, self.height))
+            self.screen = pygame.display.set_mode((self.width, self.height))
+        # the display pixel format and size may have changed
+        self.convert_caches()
+        self.build_static_bg()
+        self.mark_dirty()
+
+    def convert_caches(self):
+        """Convert the cached surfaces to the current display pixel format.
+
+        Blits between matching formats skip the per-pixel conversion.
+        """
+        self._num_surfs = {t: s.convert_alpha() for t, s in self._num_surfs.items()}
+        self._bg_surfs = {t: s.convert_alpha() for t, s in self._bg_surfs.items()}
+        self._tile_surfs = {t: s.convert_alpha() for t, s in self._tile_surfs.items()}
+        self._board_surface = self._board_surface.convert_alpha()
 
     # ---------- draw UI ----------
-    def draw_ui(self):
+    def build_static_bg(self):
+        """Render the parts of the screen that rarely change onto one surface.
+
+        Holds the background, title, instructions line, pause label and the
+        board background. Rebuild it after a scale/font/display mode change
+        or when the pause state toggles.
+        """
+        # sized to the screen, which is the whole display in fullscreen
+        bg = pygame.Surface(self.screen.get_size())
+        bg.fill(BG)
+        pygame.draw.rect(bg, BOARD_BG, (self.board_x, self.board_y, self.board_w, self.board_h), border_radius=14)
         # title
         title = self.font_big.render("Cute Number Crush", True, SCORE_COLOR)
-        self.screen.blit(title, (12, 14))
-        # score box
-        sc = self.font_small.render(f"Score: {self.score}", True, INSTR_COLOR)
-        self.screen.blit(sc, (12, 52))
+        bg.blit(title, (12, 14))
         instr = self.font_small.render("Click two adjacent tiles to swap. Match 3+ to clear. R=Restart, SPACE=Pause", True, INSTR_COLOR)
-        self.screen.blit(instr, (12, 72))
+        bg.blit(instr, (12, 72))
         if self.paused:
             p = self.font_big.render("PAUSED", True, (90, 90, 120))
-            self.screen.blit(p, ((self.width - p.get_width()) // 2, 40))
+            bg.blit(p, ((self.width - p.get_width()) // 2, 40))
+        self._static_bg = bg.convert()
+
+    def draw_ui(self):
+        # score box (the static text lives in _static_bg)
+        sc = self.font_small.render(f"Score: {self.score}", True, INSTR_COLOR)
+        rect = self.screen.blit(sc, (12, 52))
+        if self.score != self._shown_score:
+            self.mark_dirty(rect.union(self._score_rect))
+            self._shown_score = self.score
+        self._score_rect = rect
         if self.show_instructions:
             self.draw_instructions_overlay()
 
@@ -483,11 +714,16 @@ class CandyLikeGame:
                     if (self.board_x <= tx <= self.board_x + self.board_w and
                         self.board_y <= ty <= self.board_y + self.board_h):
                         self.handle_click((tx, ty))
+                # part of the window was uncovered: the skipped frames must be repainted
+                if ev.type == pygame.VIDEOEXPOSE:
+                    self.mark_dirty()
                 if ev.type == pygame.KEYDOWN:
                     if ev.key == pygame.K_r:
-                        self.__init__()  # full reset
+                        self.reset()
                     if ev.key == pygame.K_SPACE:
                         self.paused = not self.paused
+                        self.build_static_bg()
+                        self.mark_dirty()
                     if ev.key == pygame.K_t:
                         # toggle touch-friendly mode (larger UI)
                         self.toggle_touch_mode()
@@ -496,6 +732,8 @@ class CandyLikeGame:
                         self.font_big = pygame.font.SysFont("Poppins", base, bold=True)
                         self.font_tile = pygame.font.SysFont("Poppins", max(14, int(28 * self.scale)), bold=True)
                         self.font_small = pygame.font.SysFont("Poppins", max(10, int(16 * self.scale)))
+                        self.build_tile_cache()
+                        self.build_static_bg()
                     if ev.key == pygame.K_f:
                         self.toggle_fullscreen()
                     if ev.key == pygame.K_q:
@@ -506,11 +744,14 @@ class CandyLikeGame:
                 if self.swap_animation:
                     self.update_swap_anim()
 
-                # after resolving matches, always check for any leftover matches (cascades)
-                if not self.animating and not self.swap_animation:
+                # check for leftover matches (cascades), but only after the board changed
+                if self._pending_scan and not self.animating and not self.swap_animation:
+                    self._pending_scan = False
                     matches = self.board.find_matches()
                     if matches:
                         removed = self.board.remove_and_collapse(matches)
+                        self._pending_scan = True
+                        self.mark_dirty(self.board_rect())
                         # reward points, chain multiplier
                         if removed:
                             self.combo += 1
@@ -518,15 +759,18 @@ class CandyLikeGame:
                         else:
                             self.combo = 0
 
-            # drawing
-            self.screen.fill(BG)
+            # drawing: skipped entirely while nothing on screen has changed
+            if not self._needs_redraw:
+                continue
+            self.screen.blit(self._static_bg, (0, 0))
             self.draw_board()
             # highlight selected tile
             if self.selected:
                 rx, ry = self.tile_to_pixel(*self.selected)
                 pygame.draw.rect(self.screen, (255, 200, 200), (rx-4, ry-4, self.tile_size+8, self.tile_size+8), width=4, border_radius=12)
             self.draw_ui()
-            pygame.display.flip()
+            self.present()
+            self._needs_redraw = False
 
 # ---------------- Run game ----------------
 if __name__ == "__main__":
@@ -1,9 +1,18 @@
 # number_smash.py
 import pygame
-import random
 import sys
 import math
 from collections import deque
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional; flood_group falls back to a scan-line flood in Python
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        return lambda fn: fn
 
 # ----------------------------
 # Configuration
@@ -20,6 +29,9 @@ FPS = 60
 NUMBER_CYCLE_INTERVAL = 700  # ms: how often each cell changes its number (gives "constantly moving numbers")
 POP_ANIM_TIME = 200  # ms
 SHAKE_ANIM_TIME = 220  # ms
+# shake offset in px for every remaining shake time (one entry per ms)
+SHAKE_LUT = [int(6 * math.sin((t / SHAKE_ANIM_TIME) * math.pi * 8)) for t in range(SHAKE_ANIM_TIME + 1)]
+EMPTY = -1  # value of a cleared cell until gravity refills it
 
 # Colors for numbers 0-9 (vibrant palette)
 NUM_COLORS = {
@@ -46,69 +58,49 @@ SCORE_COLOR = (255, 250, 200)
 def clamp(n, a, b):
     return max(a, min(b, n))
 
-# ----------------------------
-# Cell class representing each square
-# ----------------------------
-class Cell:
-    def __init__(self, row, col, size):
-        self.row = row
-        self.col = col
-        self.size = size
-        self.value = random.randint(0, 9)
-        self.last_change = pygame.time.get_ticks() + random.randint(0, NUMBER_CYCLE_INTERVAL)
-        self.pop_anim = 0  # 0 = none, else remaining ms
-        self.shake_anim = 0
-        self.falling = False  # falling animation flag
-
-    def update_cycle(self, now):
-        # Cycle numbers periodically for dynamic effect
-        if now - self.last_change >= NUMBER_CYCLE_INTERVAL:
-            self.value = random.randint(0, 9)
-            self.last_change = now
-
-    def start_pop(self):
-        self.pop_anim = POP_ANIM_TIME
-
-    def start_shake(self):
-        self.shake_anim = SHAKE_ANIM_TIME
-
-    def draw(self, surface, x, y, font):
-        # Draw cell background
-        rect = pygame.Rect(x, y, self.size, self.size)
-        pygame.draw.rect(surface, CELL_BG, rect, border_radius=8)
-
-        # If popping, slightly scale up
-        scale = 1.0
-        if self.pop_anim > 0:
-            frac = self.pop_anim / POP_ANIM_TIME
-            scale = 1.0 + 0.18 * frac  # pop bigger when just popped
-
-        # Shake offset
-        shake_x = 0
-        if self.shake_anim > 0:
-            shake_x = int(6 * math.sin((self.shake_anim / SHAKE_ANIM_TIME) * math.pi * 8))
-
-        # Number surface
-        num = str(self.value) if self.value is not None else ""
-        if num != "":
-            txt = font.render(num, True, TEXT_COLOR)
-            tw, th = txt.get_size()
-            # colored circle behind number
-            color = NUM_COLORS.get(self.value, (180, 180, 180))
-            # circle pos center
-            cx = x + self.size // 2 + shake_x
-            cy = y + self.size // 2
-            radius = int(min(self.size // 2 - 8, (self.size // 2) * scale))
-            pygame.draw.circle(surface, color, (cx, cy), radius)
-            # draw number text centered
-            surface.blit(txt, (cx - tw // 2, cy - th // 2))
-
-    def tick(self, dt):
-        if self.pop_anim > 0:
-            self.pop_anim = max(0, self.pop_anim - dt)
-        if self.shake_anim > 0:
-            self.shake_anim = max(0, self.shake_anim - dt)
-
+def render_disk(color, radius):
+    """Filled circle of the given radius on a transparent (2r x 2r) surface."""
+    surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surf, color, (radius, radius), radius)
+    return surf.convert_alpha()
+
+@njit(boundscheck=False, cache=True)
+def _flood_nb(values, start_r, start_c):
+    """Scan-line flood from (start_r, start_c); returns the mask of its same-value group."""
+    rows, cols = values.shape
+    target = values[start_r, start_c]
+    group = np.zeros((rows, cols), dtype=np.bool_)
+    # explicit seed stack: a cell is seeded at most once from the row above and once from below
+    stack = np.empty((2 * rows * cols + 1, 2), dtype=np.int64)
+    stack[0, 0] = start_r
+    stack[0, 1] = start_c
+    n = 1
+    while n > 0:
+        n -= 1
+        r = stack[n, 0]
+        c = stack[n, 1]
+        if group[r, c]:
+            continue
+        left = c
+        while left > 0 and values[r, left - 1] == target:
+            left -= 1
+        right = c
+        while right < cols - 1 and values[r, right + 1] == target:
+            right += 1
+        group[r, left:right + 1] = True
+        for nr in (r - 1, r + 1):
+            if 0 <= nr < rows:
+                in_run = False
+                for x in range(left, right + 1):
+                    if values[nr, x] == target and not group[nr, x]:
+                        if not in_run:
+                            stack[n, 0] = nr
+                            stack[n, 1] = x
+                            n += 1
+                            in_run = True
+                    else:
+                        in_run = False
+    return group
 
 # ----------------------------
 # Game class
@@ -123,19 +115,54 @@ class NumberSmashGame:
         width = cols * (cell_size + GRID_PADDING) + GRID_PADDING
         height = rows * (cell_size + GRID_PADDING) + GRID_PADDING + TOP_MARGIN
         self.screen = pygame.display.set_mode((width, height))
+        # only queue the events the loop handles; motion events would pile up otherwise
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN, pygame.ACTIVEEVENT,
+                                  pygame.VIDEOEXPOSE])
         self.clock = pygame.time.Clock()
         self.font_big = pygame.font.SysFont("Arial", 28, bold=True)
         self.font_med = pygame.font.SysFont("Arial", 20)
         self.font_small = pygame.font.SysFont("Arial", 16)
+        # digits are rendered once; cells blit them instead of calling font.render
+        self.glyph_cache = {v: self.font_big.render(str(v), True, TEXT_COLOR).convert_alpha() for v in range(10)}
+        # colored disks keyed by (value, radius); other radii are added on first use
+        radius = cell_size // 2 - 8
+        self.disk_cache = {(v, radius): render_disk(NUM_COLORS[v], radius) for v in range(10)}
         self.grid_x = GRID_PADDING
         self.grid_y = TOP_MARGIN
+        # cell positions and grid extents only depend on the layout
+        self.cell_w = cell_size + GRID_PADDING
+        self.cell_xs = [self.grid_x + c * self.cell_w for c in range(cols)]
+        self.cell_ys = [self.grid_y + r * self.cell_w for r in range(rows)]
+        self.grid_w = cols * self.cell_w
+        self.grid_h = rows * self.cell_w
         self.running = True
+        self.active = True  # False while the window is minimized
         self.paused = False
+        self.build_background()
+        self.build_overlays()
+        if HAVE_NUMBA:
+            # compile (or load from the cache) now rather than on the first click
+            _flood_nb(np.zeros((rows, cols), dtype=np.int8), 0, 0)
 
         self.reset()
 
     def reset(self):
-        self.grid = [[Cell(r, c, self.cell_size) for c in range(self.cols)] for r in range(self.rows)]
+        # grid state as parallel arrays, one entry per cell
+        shape = (self.rows, self.cols)
+        now = pygame.time.get_ticks()
+        self.values = np.random.randint(0, 10, shape, dtype=np.int8)
+        # stagger the first number changes so the cells don't all cycle together
+        self.last_change = now + np.random.randint(0, NUMBER_CYCLE_INTERVAL + 1, shape, dtype=np.int64)
+        self.pop_anim = np.zeros(shape, dtype=np.int16)    # 0 = none, else remaining ms
+        self.shake_anim = np.zeros(shape, dtype=np.int16)
+        # update() skips the whole-grid work until something is due
+        self.next_cycle = int(self.last_change.min()) + NUMBER_CYCLE_INTERVAL  # earliest number change
+        self.animating = False  # any pop/shake timer running
+        # what draw() has to repaint: single cells, the header, or everything
+        self.dirty = np.zeros(shape, dtype=np.bool_)
+        self.ui_dirty = False
+        self.full_redraw = True
         self.score = 0
         self.message = "Click matching 0s or 1s (groups of 2+). Press R to restart. Q to quit."
         self.last_tick = pygame.time.get_ticks()
@@ -143,14 +170,71 @@ class NumberSmashGame:
         # ensure there's at least some possible match to start (optional)
         # skip guarantee to keep it simple/dynamic
 
-    def draw_ui(self):
+    def build_background(self):
+        """Pre-render the window fill, static header text, grid frame and empty cells onto one surface."""
+        bg = pygame.Surface(self.screen.get_size())
+        bg.fill(WINDOW_BG)
+        gw = self.cols * (self.cell_size + GRID_PADDING) + GRID_PADDING
+        gh = self.rows * (self.cell_size + GRID_PADDING) + GRID_PADDING
+        pygame.draw.rect(bg, GRID_BG, (self.grid_x - GRID_PADDING//2, self.grid_y - GRID_PADDING//2, gw, gh), border_radius=12)
+        for r in range(self.rows):
+            for c in range(self.cols):
+                x, y = self.grid_to_screen(r, c)
+                pygame.draw.rect(bg, CELL_BG, (x, y, self.cell_size, self.cell_size), border_radius=8)
         # header / instructions
         title = self.font_big.render("Number Smash", True, SCORE_COLOR)
-        self.screen.blit(title, (12, 12))
+        bg.blit(title, (12, 12))
+        instr = self.font_small.render("Smash groups of 2+ zeros or ones. Click a cell to smash. R=Restart  Space=Pause", True, INSTR_COLOR)
+        bg.blit(instr, (12, 82))
+        self.bg_surface = bg.convert()
+
+    def build_overlays(self):
+        """Pre-render the paused and instructions overlays as lists of (surface, pos) blits.
+
+        The translucent boxes and the text stay separate surfaces, blitted in
+        order, so the screen looks exactly as when they were drawn one by one.
+        """
+        w = self.screen.get_width()
+        h = self.screen.get_height()
+        # paused
+        overlay = pygame.Surface((w, h), pygame.SRCALPHA)
+        overlay.fill((8, 8, 12, 160))
+        txt = self.font_big.render("PAUSED", True, (240,240,240))
+        hint = self.font_med.render("Press SPACE to resume", True, INSTR_COLOR)
+        self.paused_blits = [
+            (overlay.convert_alpha(), (0, 0)),
+            (txt.convert_alpha(), ((w-txt.get_width())//2, 200)),
+            (hint.convert_alpha(), ((w-hint.get_width())//2, 250)),
+        ]
+        # instructions, centered
+        overlay = pygame.Surface((w-80, h-160), pygame.SRCALPHA)
+        overlay.fill((12, 14, 18, 230))
+        ox = 40
+        oy = 60
+        blits = [(overlay, (ox, oy))]
+        title = self.font_big.render("How to play — Number Smash", True, SCORE_COLOR)
+        blits.append((title, (ox+20, oy+18)))
+        lines = [
+            "• The grid contains numbers 0–9 which constantly change every moment.",
+            "• You may SMASH only groups of 2 or more same-number tiles when that number is 0 or 1.",
+            "• Click a tile (left mouse). If it is 0 or 1 and part of a group (>=2), the whole group is removed.",
+            "• Numbers above fall down and new numbers spawn at the top.",
+            "• Distractors: numbers 2–9 cannot be smashed (but they'll block matches until they change).",
+            "• Controls: Click = Smash | R = Restart | SPACE = Pause/Unpause | Q / Close = Quit",
+            "• Score increases by group_size * (value + 1). Have fun!"
+        ]
+        y = oy + 68
+        for line in lines:
+            blits.append((self.font_small.render(line, True, INSTR_COLOR), (ox + 20, y)))
+            y += 28
+        note = self.font_med.render("Click anywhere on this box to continue...", True, (210,210,210))
+        blits.append((note, (ox + 20, y + 6)))
+        self.instructions_blits = [(surf.convert_alpha(), pos) for surf, pos in blits]
+
+    def draw_ui(self):
+        # title and instructions line are part of bg_surface
         sc = self.font_med.render(f"Score: {self.score}", True, SCORE_COLOR)
         self.screen.blit(sc, (12, 50))
-        instr = self.font_small.render("Smash groups of 2+ zeros or ones. Click a cell to smash. R=Restart  Space=Pause", True, INSTR_COLOR)
-        self.screen.blit(instr, (12, 82))
 
         # optional message at top-right
         msg = self.font_small.render(self.message, True, INSTR_COLOR)
@@ -158,135 +242,223 @@ class NumberSmashGame:
         self.screen.blit(msg, (w - msg.get_width() - 12, 50))
 
     def grid_to_screen(self, r, c):
-        x = self.grid_x + c * (self.cell_size + GRID_PADDING)
-        y = self.grid_y + r * (self.cell_size + GRID_PADDING)
-        return x, y
+        return self.cell_xs[c], self.cell_ys[r]
 
     def screen_to_grid(self, mx, my):
         mx -= self.grid_x
         my -= self.grid_y
-        if mx < 0 or my < 0:
+        if not (0 <= mx < self.grid_w and 0 <= my < self.grid_h):
             return None
-        cell_w = self.cell_size + GRID_PADDING
-        c = mx // cell_w
-        r = my // cell_w
-        if 0 <= r < self.rows and 0 <= c < self.cols:
-            # ensure inside actual square area (not in padding)
-            rx = mx % cell_w
-            ry = my % cell_w
-            if rx <= self.cell_size and ry <= self.cell_size:
-                return int(r), int(c)
+        c, rx = divmod(mx, self.cell_w)
+        r, ry = divmod(my, self.cell_w)
+        # ensure inside actual square area (not in padding)
+        if rx <= self.cell_size and ry <= self.cell_size:
+            return int(r), int(c)
         return None
 
-    def in_bounds(self, r, c):
-        return 0 <= r < self.rows and 0 <= c < self.cols
-
     def flood_group(self, start_r, start_c):
-        # BFS for 4-way adjacent same value
-        target = self.grid[start_r][start_c].value
-        if target is None:
-            return []
-        visited = [[False]*self.cols for _ in range(self.rows)]
+        """Boolean mask of the 4-way connected cells sharing the value at (start_r, start_c)."""
+        target = self.values[start_r, start_c]
+        if target == EMPTY:
+            return np.zeros((self.rows, self.cols), dtype=np.bool_)
+        if HAVE_NUMBA:
+            return _flood_nb(self.values, start_r, start_c)
+        # scan-line flood: fill a whole horizontal run at a time, then queue
+        # one seed per matching run in the rows above and below
+        rows, cols = self.rows, self.cols
+        vals = self.values.tolist()
+        seen = 0  # visited bitmap, bit r * cols + c
+        group = np.zeros((rows, cols), dtype=np.bool_)
         q = deque()
         q.append((start_r, start_c))
-        visited[start_r][start_c] = True
-        group = [(start_r, start_c)]
         while q:
             r, c = q.popleft()
-            for dr, dc in ((1,0),(-1,0),(0,1),(0,-1)):
-                nr, nc = r + dr, c + dc
-                if self.in_bounds(nr, nc) and not visited[nr][nc]:
-                    cell = self.grid[nr][nc]
-                    if cell.value == target:
-                        visited[nr][nc] = True
-                        q.append((nr, nc))
-                        group.append((nr, nc))
+            if seen >> (r * cols + c) & 1:
+                continue
+            row = vals[r]
+            left = c
+            while left > 0 and row[left - 1] == target:
+                left -= 1
+            right = c
+            while right < cols - 1 and row[right + 1] == target:
+                right += 1
+            seen |= ((1 << (right - left + 1)) - 1) << (r * cols + left)
+            group[r, left:right + 1] = True
+            for nr in (r - 1, r + 1):
+                if 0 <= nr < rows:
+                    base = nr * cols
+                    nrow = vals[nr]
+                    in_run = False
+                    for x in range(left, right + 1):
+                        if nrow[x] == target and not seen >> (base + x) & 1:
+                            if not in_run:
+                                q.append((nr, x))
+                                in_run = True
+                        else:
+                            in_run = False
         return group
 
     def smash_at(self, r, c):
         # attempt to smash the group at r,c
-        cell = self.grid[r][c]
-        val = cell.value
+        val = int(self.values[r, c])
         if val not in (0, 1):
             # cannot smash distractors
-            cell.start_shake()
+            self.shake_anim[r, c] = SHAKE_ANIM_TIME
+            self.animating = True
+            self.dirty[r, c] = True
+            self.ui_dirty = True
             self.message = "You can only smash groups of 0s or 1s!"
             return False
         group = self.flood_group(r, c)
-        if len(group) < 2:
-            cell.start_shake()
-            self.message = f"Need group of 2+ {val}s to smash (found {len(group)})."
+        count = int(group.sum())
+        if count < 2:
+            self.shake_anim[r, c] = SHAKE_ANIM_TIME
+            self.animating = True
+            self.dirty[r, c] = True
+            self.ui_dirty = True
+            self.message = f"Need group of 2+ {val}s to smash (found {count})."
             return False
         # smash: clear those cells
-        for (gr, gc) in group:
-            self.grid[gr][gc].start_pop()
-            # mark as cleared after short delay (we'll directly clear)
-            self.grid[gr][gc].value = None
+        self.pop_anim[group] = POP_ANIM_TIME
+        self.animating = True
+        # gravity moves numbers anywhere in the grid
+        self.dirty[:] = True
+        self.ui_dirty = True
+        self.values[group] = EMPTY
         self.apply_gravity()
         # scoring: reward group_size * (value + 1)
-        gain = len(group) * (val + 1)
+        gain = count * (val + 1)
         self.score += gain
-        self.message = f"Smashed {len(group)} of {val}! +{gain} points"
+        self.message = f"Smashed {count} of {val}! +{gain} points"
         return True
 
     def apply_gravity(self):
-        # For each column, let numbers fall down to bottom, new random numbers spawn on top
-        for c in range(self.cols):
-            stack = []
-            for r in range(self.rows):
-                val = self.grid[r][c].value
-                if val is not None:
-                    stack.append(val)
-            # fill bottom up
-            rptr = self.rows - 1
-            for val in reversed(stack):
-                self.grid[rptr][c].value = val
-                rptr -= 1
-            # fill remaining top cells with new random numbers
-            while rptr >= 0:
-                self.grid[rptr][c].value = random.randint(0, 9)
-                rptr -= 1
-        # small chance to randomize some cells slightly to keep dynamic visuals
-        for r in range(self.rows):
-            for c in range(self.cols):
-                self.grid[r][c].last_change = pygame.time.get_ticks()
+        # Let numbers fall down to the bottom of every column at once: a stable
+        # sort on "is filled" moves the empty cells to the top, numbers keep their order
+        empty = self.values == EMPTY
+        order = np.argsort(~empty, axis=0, kind='stable')
+        self.values[:] = np.take_along_axis(self.values, order, axis=0)
+        # new random numbers spawn in the gaps on top, drawn in one batch
+        gap = np.arange(self.rows)[:, None] < empty.sum(axis=0)
+        self.values[gap] = np.random.randint(0, 10, int(empty.sum()), dtype=np.int8)
+        # every cell restarts its cycle timer from now
+        now = pygame.time.get_ticks()
+        self.last_change.fill(now)
+        self.next_cycle = now + NUMBER_CYCLE_INTERVAL
 
     def update(self, dt):
         now = pygame.time.get_ticks()
         if not self.paused:
-            # update cycle for each cell (number change)
-            for r in range(self.rows):
-                for c in range(self.cols):
-                    cell = self.grid[r][c]
-                    cell.update_cycle(now)
-                    cell.tick(dt)
+            # cycle numbers periodically for dynamic effect
+            if now >= self.next_cycle:
+                due = (now - self.last_change) >= NUMBER_CYCLE_INTERVAL
+                n = int(due.sum())
+                if n:
+                    self.values[due] = np.random.randint(0, 10, n, dtype=np.int8)
+                    self.last_change[due] = now
+                    self.dirty |= due
+                self.next_cycle = int(self.last_change.min()) + NUMBER_CYCLE_INTERVAL
+            # count animations down, stopping at zero (a long frame can't overflow int16)
+            if self.animating:
+                # cells are redrawn until (and including) the frame their timers reach zero
+                self.dirty |= (self.pop_anim > 0) | (self.shake_anim > 0)
+                step = min(dt, max(POP_ANIM_TIME, SHAKE_ANIM_TIME))
+                np.maximum(self.pop_anim - step, 0, out=self.pop_anim)
+                np.maximum(self.shake_anim - step, 0, out=self.shake_anim)
+                self.animating = bool(self.pop_anim.any() or self.shake_anim.any())
+
+    def cell_sprites(self, r, c, x, y):
+        """Return ((disk, pos), (digit, pos)) for blitting cell (r, c), or None if empty.
+
+        The cell background is part of the pre-rendered bg_surface.
+        """
+        val = int(self.values[r, c])
+        if val == EMPTY:
+            return None
+        # If popping, slightly scale up
+        scale = 1.0
+        pop = int(self.pop_anim[r, c])
+        if pop > 0:
+            frac = pop / POP_ANIM_TIME
+            scale = 1.0 + 0.18 * frac  # pop bigger when just popped
 
-    def draw(self):
-        self.screen.fill(WINDOW_BG)
-        # grid background area
-        gw = self.cols * (self.cell_size + GRID_PADDING) + GRID_PADDING
-        gh = self.rows * (self.cell_size + GRID_PADDING) + GRID_PADDING
-        pygame.draw.rect(self.screen, GRID_BG, (self.grid_x - GRID_PADDING//2, self.grid_y - GRID_PADDING//2, gw, gh), border_radius=12)
+        # Shake offset
+        shake_x = SHAKE_LUT[self.shake_anim[r, c]]
+
+        txt = self.glyph_cache[val]
+        tw, th = txt.get_size()
+        # colored circle behind number
+        color = NUM_COLORS.get(val, (180, 180, 180))
+        # circle pos center
+        size = self.cell_size
+        cx = x + size // 2 + shake_x
+        cy = y + size // 2
+        radius = int(min(size // 2 - 8, (size // 2) * scale))
+        disk = self.disk_cache.get((val, radius))
+        if disk is None:
+            disk = self.disk_cache[(val, radius)] = render_disk(color, radius)
+        # number text centered on the disk
+        return (disk, (cx - radius, cy - radius)), (txt, (cx - tw // 2, cy - th // 2))
 
-        # draw grid cells
-        for r in range(self.rows):
-            for c in range(self.cols):
-                x, y = self.grid_to_screen(r, c)
-                cell = self.grid[r][c]
-                cell.draw(self.screen, x, y, self.font_big)
+    def draw(self):
+        """Repaint what changed since the last frame and push only those rects to the display."""
+        overlay = self.paused or self.show_instructions
+        if self.full_redraw or (overlay and (self.ui_dirty or self.dirty.any())):
+            # the translucent overlays cover the grid, so any change under them repaints everything
+            self.draw_full()
+        elif not overlay:
+            self.draw_dirty()
+        self.dirty[:] = False
+        self.ui_dirty = False
+        self.full_redraw = False
+
+    def draw_dirty(self):
+        rects = []
+        if self.ui_dirty:
+            header = pygame.Rect(0, 0, self.screen.get_width(), self.grid_y - GRID_PADDING//2)
+            self.screen.blit(self.bg_surface, header, header)
+            self.draw_ui()
+            rects.append(header)
+        if self.dirty.any():
+            # a cell's disk and digit stay inside its square, even while shaking
+            disk_blits = []
+            glyph_blits = []
+            for r, c in np.argwhere(self.dirty).tolist():
+                x, y = self.cell_xs[c], self.cell_ys[r]
+                rect = pygame.Rect(x, y, self.cell_size, self.cell_size)
+                self.screen.blit(self.bg_surface, rect, rect)
+                sprites = self.cell_sprites(r, c, x, y)
+                if sprites:
+                    disk_blits.append(sprites[0])
+                    glyph_blits.append(sprites[1])
+                rects.append(rect)
+            self.screen.blits(disk_blits, doreturn=False)
+            self.screen.blits(glyph_blits, doreturn=False)
+        if rects:
+            pygame.display.update(rects)
+
+    def draw_full(self):
+        # window fill, grid frame and empty cells in one blit
+        self.screen.blit(self.bg_surface, (0, 0))
+
+        # draw grid cells: all disks, then all digits, each as one batched blits call
+        disk_blits = []
+        glyph_blits = []
+        for r, y in enumerate(self.cell_ys):
+            for c, x in enumerate(self.cell_xs):
+                sprites = self.cell_sprites(r, c, x, y)
+                if sprites:
+                    disk_blits.append(sprites[0])
+                    glyph_blits.append(sprites[1])
+        self.screen.blits(disk_blits, doreturn=False)
+        self.screen.blits(glyph_blits, doreturn=False)
 
         # UI overlays
         self.draw_ui()
 
         # If paused or showing instructions overlay
         if self.paused:
-            overlay = pygame.Surface((self.screen.get_width(), self.screen.get_height()), pygame.SRCALPHA)
-            overlay.fill((8, 8, 12, 160))
-            self.screen.blit(overlay, (0,0))
-            txt = self.font_big.render("PAUSED", True, (240,240,240))
-            self.screen.blit(txt, ((self.screen.get_width()-txt.get_width())//2, 200))
-            hint = self.font_med.render("Press SPACE to resume", True, INSTR_COLOR)
-            self.screen.blit(hint, ((self.screen.get_width()-hint.get_width())//2, 250))
+            self.screen.blits(self.paused_blits, doreturn=False)
 
         if self.show_instructions:
             self.draw_instructions()
@@ -294,33 +466,7 @@ class NumberSmashGame:
         pygame.display.flip()
 
     def draw_instructions(self):
-        w = self.screen.get_width()
-        h = self.screen.get_height()
-        overlay = pygame.Surface((w-80, h-160), pygame.SRCALPHA)
-        overlay.fill((12, 14, 18, 230))
-        # centered
-        ox = 40
-        oy = 60
-        self.screen.blit(overlay, (ox, oy))
-        title = self.font_big.render("How to play — Number Smash", True, SCORE_COLOR)
-        self.screen.blit(title, (ox+20, oy+18))
-        lines = [
-            "• The grid contains numbers 0–9 which constantly change every moment.",
-            "• You may SMASH only groups of 2 or more same-number tiles when that number is 0 or 1.",
-            "• Click a tile (left mouse). If it is 0 or 1 and part of a group (>=2), the whole group is removed.",
-            "• Numbers above fall down and new numbers spawn at the top.",
-            "• Distractors: numbers 2–9 cannot be smashed (but they'll block matches until they change).",
-            "• Controls: Click = Smash | R = Restart | SPACE = Pause/Unpause | Q / Close = Quit",
-            "• Score increases by group_size * (value + 1). Have fun!"
-        ]
-        y = oy + 68
-        for line in lines:
-            txt = self.font_small.render(line, True, INSTR_COLOR)
-            self.screen.blit(txt, (ox + 20, y))
-            y += 28
-
-        note = self.font_med.render("Click anywhere on this box to continue...", True, (210,210,210))
-        self.screen.blit(note, (ox + 20, y + 6))
+        self.screen.blits(self.instructions_blits, doreturn=False)
 
     def handle_click(self, pos):
         # clicking while instructions visible dismisses them
@@ -331,6 +477,7 @@ class NumberSmashGame:
             rect = pygame.Rect(40, 60, w-80, h-160)
             if rect.collidepoint(pos):
                 self.show_instructions = False
+                self.full_redraw = True
             return
 
         g = self.screen_to_grid(*pos)
@@ -353,10 +500,22 @@ class NumberSmashGame:
                         self.reset()
                     elif ev.key == pygame.K_SPACE:
                         self.paused = not self.paused
+                        self.full_redraw = True
+                elif ev.type == pygame.ACTIVEEVENT and ev.state & pygame.APPACTIVE:
+                    self.active = bool(ev.gain)
+                    # the restored window needs a complete frame
+                    self.full_redraw = True
+                elif ev.type == pygame.VIDEOEXPOSE:
+                    # part of the window was uncovered; its old contents are gone
+                    self.full_redraw = True
 
             if not self.paused:
                 self.update(dt)
-            self.draw()
+            if self.active:
+                self.draw()
+            else:
+                # nothing is visible: don't draw, and don't spin at full frame rate
+                pygame.time.wait(100)
         pygame.quit()
         sys.exit()
 
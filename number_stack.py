@@ -11,6 +11,7 @@ CELL_SIZE = 60
 GRID_PADDING = 5
 TOP_MARGIN = 120
 FPS = 60
+EMPTY = -1  # grid value of a cleared cell
 
 BG_COLOR = (25, 25, 30)
 GRID_COLOR = (45, 45, 50)
@@ -33,17 +34,38 @@ class NumberStack:
         width = COLS * (CELL_SIZE + GRID_PADDING) + GRID_PADDING
         height = ROWS * (CELL_SIZE + GRID_PADDING) + GRID_PADDING + TOP_MARGIN
         self.screen = pygame.display.set_mode((width, height))
+        # only queue the events the loop handles; motion events would pile up otherwise
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN, pygame.ACTIVEEVENT])
         self.clock = pygame.time.Clock()
         self.font_big = pygame.font.SysFont("Arial", 28, bold=True)
         self.font_small = pygame.font.SysFont("Arial", 18)
+        # one pre-rendered digit per value (0 and 1 in the special color)
+        self.glyph_cache = {
+            v: self.font_big.render(str(v), True, SPECIAL_COLOR if v in (0, 1) else NUM_COLOR).convert_alpha()
+            for v in range(10)
+        }
+        self.title_surf = self.font_big.render("Number Stack", True, TEXT_COLOR).convert_alpha()
+        # the falling number drawn as one surface per value: rounded cell plus digit
+        self.fall_tiles = {}
+        for v, text in self.glyph_cache.items():
+            tile = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
+            pygame.draw.rect(tile, CELL_COLOR, (0, 0, CELL_SIZE, CELL_SIZE), border_radius=6)
+            tile.blit(text, (CELL_SIZE//2 - text.get_width()//2, CELL_SIZE//2 - text.get_height()//2))
+            self.fall_tiles[v] = tile.convert_alpha()
 
         self.grid_x = GRID_PADDING
         self.grid_y = TOP_MARGIN
+        # cell positions only depend on the layout
+        self.cell_xs = [self.grid_x + c * (CELL_SIZE + GRID_PADDING) for c in range(COLS)]
+        self.cell_ys = [self.grid_y + r * (CELL_SIZE + GRID_PADDING) for r in range(ROWS)]
         self.running = True
+        self.active = True  # False while the window is minimized
         self.reset()
 
     def reset(self):
-        self.grid = [[None for _ in range(COLS)] for _ in range(ROWS)]
+        self.grid = [[EMPTY] * COLS for _ in range(ROWS)]
+        self.col_heights = [ROWS] * COLS  # row of the topmost filled cell per column (ROWS if empty)
         self.falling_number = None
         self.fall_y = 0
         self.fall_col = random.randint(0, COLS - 1)
@@ -56,12 +78,21 @@ class NumberStack:
 
     # ------------- Grid helpers ----------------
     def grid_to_screen(self, r, c):
-        x = self.grid_x + c * (CELL_SIZE + GRID_PADDING)
-        y = self.grid_y + r * (CELL_SIZE + GRID_PADDING)
-        return x, y
+        return self.cell_xs[c], self.cell_ys[r]
 
-    def in_bounds(self, r, c):
-        return 0 <= r < ROWS and 0 <= c < COLS
+    def screen_to_grid(self, mx, my):
+        """Cell (r, c) under a screen position, or None if outside every cell."""
+        cell_w = CELL_SIZE + GRID_PADDING
+        mx -= self.grid_x
+        my -= self.grid_y
+        if not (0 <= mx < COLS * cell_w and 0 <= my < ROWS * cell_w):
+            return None
+        c, rx = divmod(mx, cell_w)
+        r, ry = divmod(my, cell_w)
+        # ensure inside actual square area (not in padding)
+        if rx < CELL_SIZE and ry < CELL_SIZE:
+            return r, c
+        return None
 
     # ------------- Falling logic ----------------
     def spawn_new_number(self):
@@ -71,7 +102,7 @@ class NumberStack:
         self.falling_number = True
 
         # If top cell in that column is filled — Game Over
-        if self.grid[0][self.fall_col] is not None:
+        if self.grid[0][self.fall_col] != EMPTY:
             self.game_over = True
             self.falling_number = False
             self.message = "Game Over! Press R to restart."
@@ -81,18 +112,13 @@ class NumberStack:
         if not self.falling_number or self.game_over:
             return
 
-        # Find where it should land
-        for row in range(ROWS):
-            below_filled = (
-                row == ROWS - 1 or self.grid[row + 1][self.fall_col] is not None
-            )
-            if below_filled:
-                # If reached the bottom or above a filled cell
-                if self.fall_y >= row * (CELL_SIZE + GRID_PADDING):
-                    # Land it
-                    self.grid[row][self.fall_col] = self.fall_value
-                    self.falling_number = False
-                    break
+        # It lands on top of its column's stack (looked up every frame: smashing can lower it)
+        row = self.col_heights[self.fall_col] - 1
+        if self.fall_y >= row * (CELL_SIZE + GRID_PADDING):
+            # Land it
+            self.grid[row][self.fall_col] = self.fall_value
+            self.col_heights[self.fall_col] = row
+            self.falling_number = False
 
         self.fall_y += FALL_SPEED
 
@@ -101,20 +127,37 @@ class NumberStack:
         target = self.grid[start_r][start_c]
         if target not in (0, 1):
             return []
-        visited = [[False]*COLS for _ in range(ROWS)]
+        # scan-line flood: take a whole horizontal run at a time, then queue
+        # one seed per matching run in the rows above and below
+        visited = 0  # bitmap, bit r * COLS + c
         q = deque()
         q.append((start_r, start_c))
-        visited[start_r][start_c] = True
-        group = [(start_r, start_c)]
+        group = []
         while q:
             r, c = q.popleft()
-            for dr, dc in [(1,0),(-1,0),(0,1),(0,-1)]:
-                nr, nc = r+dr, c+dc
-                if self.in_bounds(nr, nc) and not visited[nr][nc]:
-                    if self.grid[nr][nc] == target:
-                        visited[nr][nc] = True
-                        q.append((nr, nc))
-                        group.append((nr, nc))
+            if visited >> (r * COLS + c) & 1:
+                continue
+            row = self.grid[r]
+            left = c
+            while left > 0 and row[left - 1] == target:
+                left -= 1
+            right = c
+            while right < COLS - 1 and row[right + 1] == target:
+                right += 1
+            visited |= ((1 << (right - left + 1)) - 1) << (r * COLS + left)
+            group.extend((r, x) for x in range(left, right + 1))
+            for nr in (r - 1, r + 1):
+                if 0 <= nr < ROWS:
+                    base = nr * COLS
+                    nrow = self.grid[nr]
+                    in_run = False
+                    for x in range(left, right + 1):
+                        if nrow[x] == target and not visited >> (base + x) & 1:
+                            if not in_run:
+                                q.append((nr, x))
+                                in_run = True
+                        else:
+                            in_run = False
         return group
 
     def smash(self, r, c):
@@ -128,7 +171,7 @@ class NumberStack:
 
         # Smash them (remove)
         for gr, gc in group:
-            self.grid[gr][gc] = None
+            self.grid[gr][gc] = EMPTY
         self.score += len(group) * 10
         self.message = f"Smashed {len(group)} tiles! +{len(group)*10} points."
         self.apply_gravity()
@@ -136,42 +179,41 @@ class NumberStack:
     def apply_gravity(self):
         """Make numbers fall down to fill empty spaces"""
         for c in range(COLS):
-            stack = [self.grid[r][c] for r in range(ROWS) if self.grid[r][c] is not None]
+            stack = [self.grid[r][c] for r in range(ROWS) if self.grid[r][c] != EMPTY]
+            self.col_heights[c] = ROWS - len(stack)
             for r in range(ROWS - 1, -1, -1):
                 if stack:
                     self.grid[r][c] = stack.pop()
                 else:
-                    self.grid[r][c] = None
+                    self.grid[r][c] = EMPTY
 
     # ------------- Drawing ----------------
     def draw_grid(self):
-        for r in range(ROWS):
-            for c in range(COLS):
-                x, y = self.grid_to_screen(r, c)
-                pygame.draw.rect(self.screen, CELL_COLOR, (x, y, CELL_SIZE, CELL_SIZE), border_radius=6)
-                val = self.grid[r][c]
-                if val is not None:
-                    color = SPECIAL_COLOR if val in (0, 1) else NUM_COLOR
-                    text = self.font_big.render(str(val), True, color)
-                    self.screen.blit(
-                        text, (x + CELL_SIZE//2 - text.get_width()//2, y + CELL_SIZE//2 - text.get_height()//2)
-                    )
+        # cell backgrounds first, then every digit in one batched blits call
+        glyph_blits = []
+        # all rects are drawn under one lock; blits need the surface unlocked again
+        self.screen.lock()
+        try:
+            for r, y in enumerate(self.cell_ys):
+                for c, x in enumerate(self.cell_xs):
+                    pygame.draw.rect(self.screen, CELL_COLOR, (x, y, CELL_SIZE, CELL_SIZE), border_radius=6)
+                    val = self.grid[r][c]
+                    if val != EMPTY:
+                        text = self.glyph_cache[val]
+                        glyph_blits.append(
+                            (text, (x + CELL_SIZE//2 - text.get_width()//2, y + CELL_SIZE//2 - text.get_height()//2))
+                        )
+        finally:
+            self.screen.unlock()
+        self.screen.blits(glyph_blits, doreturn=False)
 
     def draw_falling(self):
         if not self.falling_number or self.game_over:
             return
-        c = self.fall_col
-        val = self.fall_value
-        x = self.grid_x + c * (CELL_SIZE + GRID_PADDING)
-        y = self.grid_y + self.fall_y
-        pygame.draw.rect(self.screen, CELL_COLOR, (x, y, CELL_SIZE, CELL_SIZE), border_radius=6)
-        color = SPECIAL_COLOR if val in (0, 1) else NUM_COLOR
-        text = self.font_big.render(str(val), True, color)
-        self.screen.blit(text, (x + CELL_SIZE//2 - text.get_width()//2, y + CELL_SIZE//2 - text.get_height()//2))
+        self.screen.blit(self.fall_tiles[self.fall_value], (self.cell_xs[self.fall_col], self.grid_y + self.fall_y))
 
     def draw_ui(self):
-        title = self.font_big.render("Number Stack", True, TEXT_COLOR)
-        self.screen.blit(title, (10, 15))
+        self.screen.blit(self.title_surf, (10, 15))
         score_text = self.font_small.render(f"Score: {self.score}", True, TEXT_COLOR)
         self.screen.blit(score_text, (10, 60))
         msg = self.font_small.render(self.message, True, (180, 180, 180))
@@ -181,20 +223,16 @@ class NumberStack:
     def handle_click(self, pos):
         if self.game_over:
             return
-        mx, my = pos
-        for r in range(ROWS):
-            for c in range(COLS):
-                x, y = self.grid_to_screen(r, c)
-                rect = pygame.Rect(x, y, CELL_SIZE, CELL_SIZE)
-                if rect.collidepoint(mx, my) and self.grid[r][c] is not None:
-                    self.smash(r, c)
-                    return
+        g = self.screen_to_grid(*pos)
+        if g:
+            r, c = g
+            if self.grid[r][c] != EMPTY:
+                self.smash(r, c)
 
     # ------------- Main loop ----------------
     def run(self):
         while self.running:
             dt = self.clock.tick(FPS)
-            self.screen.fill(BG_COLOR)
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -208,6 +246,8 @@ class NumberStack:
                         self.reset()
                     elif event.key == pygame.K_SPACE:
                         self.paused = not self.paused
+                elif event.type == pygame.ACTIVEEVENT and event.state & pygame.APPACTIVE:
+                    self.active = bool(event.gain)
 
             if not self.paused and not self.game_over:
                 now = pygame.time.get_ticks()
@@ -218,7 +258,13 @@ class NumberStack:
                 if self.falling_number:
                     self.drop_number()
 
+            if not self.active:
+                # nothing is visible: don't draw, and don't spin at full frame rate
+                pygame.time.wait(100)
+                continue
+
             # Draw everything
+            self.screen.fill(BG_COLOR)
             pygame.draw.rect(
                 self.screen, GRID_COLOR,
                 (self.grid_x - GRID_PADDING//2, self.grid_y - GRID_PADDING//2,